@@ -4,6 +4,7 @@ import functools
 import warnings
 from importlib import import_module
 from pathlib import Path
+from types import ModuleType
 from typing import Optional, Union
 
 from qcio import CalcType, ProgramInput, SinglePointResults
@@ -16,6 +17,18 @@ from .utils import get_file_contents
 __all__ = ["parse", "parse_results", "encode", "registry"]
 
 
+@functools.lru_cache(maxsize=None)
+def _parsers_module(program: str) -> ModuleType:
+    """Import the parsers module for a program once and reuse it."""
+    return import_module(f"qcparse.parsers.{program}")
+
+
+@functools.lru_cache(maxsize=None)
+def _encoder_module(program: str) -> ModuleType:
+    """Import the encoder module for a program once and reuse it."""
+    return import_module(f"qcparse.encoders.{program}")
+
+
 def parse(
     data_or_path: Union[str, bytes, Path],
     program: str,
@@ -44,7 +57,7 @@ def parse(
         ParserError: If no parsers are registered for the filetype of the program.
         MatchNotFoundError: If a required parser fails to parse its data.
     """
-    parsers = import_module(f"qcparse.parsers.{program}")
+    parsers = _parsers_module(program)
 
     # Check that filetype is supported by the program's parsers
     if filetype not in parsers.SUPPORTED_FILETYPES:
@@ -99,7 +112,7 @@ def encode(inp_data: ProgramInput, program: str) -> NativeInput:
             input is invalid.
     """
     # Check that calctype is supported by the encoder
-    encoder = import_module(f"qcparse.encoders.{program}")
+    encoder = _encoder_module(program)
     if inp_data.calctype not in encoder.SUPPORTED_CALCTYPES:
         raise EncoderError(f"Calctype '{inp_data.calctype}' not supported by encoder.")
 
@@ -5,7 +5,7 @@ from enum import Enum
 from types import SimpleNamespace
 from typing import Callable, Optional
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, PrivateAttr, model_validator
 from qcio import CalcType
 
 from .exceptions import RegistryError
@@ -33,6 +33,9 @@ class ParserRegistry(BaseModel):
     """Registry for parser functions."""
 
     registry: dict[str, list[ParserSpec]] = defaultdict(list)
+    # get_parsers() results keyed by (program, filetype, calctype). Stored as tuples
+    # so callers mutating a returned list can't alter the cache or the registry.
+    _index: dict[tuple, tuple[ParserSpec, ...]] = PrivateAttr(default_factory=dict)
 
     def register(self, program: str, parser_spec: ParserSpec) -> None:
         """Register a new parser function.
@@ -43,6 +46,7 @@ class ParserRegistry(BaseModel):
                 information about the parser.
         """
         self.registry[program].append(parser_spec)
+        self._index.clear()
 
     def get_parsers(
         self,
@@ -60,6 +64,9 @@ class ParserRegistry(BaseModel):
         Returns:
             List of ParserSpec objects.
         """
+        key = (program, filetype, calctype)
+        if key in self._index:
+            return list(self._index[key])
 
         parser_specs: list[ParserSpec] = self.registry[program]
         if not parser_specs:
@@ -71,7 +78,9 @@ class ParserRegistry(BaseModel):
 
         if calctype:
             parser_specs = [ps for ps in parser_specs if calctype in ps.calctypes]
-        return parser_specs
+
+        self._index[key] = tuple(parser_specs)
+        return list(parser_specs)
 
     def supported_programs(self) -> list[str]:
         """Get all programs with registered parsers.
@@ -1,3 +1,4 @@
+import math
 import re
 from pathlib import Path
 from typing import Any, Optional, Union
@@ -14,17 +15,24 @@ from qcio import (
     Structure,
 )
 
+from qcparse.exceptions import ParserError
+
 from .utils import regex_search
 
+_VERSION_REGEX = re.compile(r"Version (\d+\.\d+\.\d+),", re.ASCII)
+_ENERGY_REGEX = re.compile(r"# Energy \( Eh \)\n#*\n\s*([-\d.]+)", re.ASCII)
+_GRADIENT_REGEX = re.compile(
+    r"# Gradient \( Eh/a0 \)\n#\s*\n((?:\s*[-\d.]+\n)+)", re.ASCII
+)
+_NUMHESS_ENERGY_REGEX = re.compile(r"Energy\s*=\s*([-+]?\d+\.\d+)\s*Eh", re.ASCII)
+
 
 def parse_version_string(string: str) -> str:
     """Parse version string from CREST stdout.
 
     Matches format of 'crest --version' on command line.
     """
-    regex = r"Version (\d+\.\d+\.\d+),"
-    match = regex_search(regex, string)
-    return match.group(1)
+    return regex_search(_VERSION_REGEX, string).group(1)
 
 
 def parse_structures(
@@ -55,6 +63,18 @@ def parse_structures(
     return structures
 
 
+def _comment_energies(structures: list[Structure]) -> np.ndarray:
+    """Collect the energy from each structure's xyz comment line into one array.
+
+    CREST places the energy as the only value in the comment line.
+    """
+    return np.fromiter(
+        (float(struct.extras[Structure._xyz_comment_key][0]) for struct in structures),
+        dtype=float,
+        count=len(structures),
+    )
+
+
 def parse_conformer_search_dir(
     directory: Union[Path, str],
     *,
@@ -79,8 +99,7 @@ def parse_conformer_search_dir(
         directory / "crest_conformers.xyz", charge=charge, multiplicity=multiplicity
     )
 
-    # CREST places the energy as the only value in the comment line
-    conf_energies = [conf.extras[Structure._xyz_comment_key][0] for conf in conformers]
+    conf_energies = _comment_energies(conformers)
 
     rotamers = []
     if collect_rotamers:
@@ -88,14 +107,13 @@ def parse_conformer_search_dir(
             directory / "crest_rotamers.xyz", charge=charge, multiplicity=multiplicity
         )
 
-    # CREST places the energy as the only value in the comment line
-    rotamer_energies = [rot.extras[Structure._xyz_comment_key][0] for rot in rotamers]
+    rotamer_energies = _comment_energies(rotamers)
 
     return ConformerSearchResults(
         conformers=conformers,
-        conformer_energies=np.array(conf_energies),
+        conformer_energies=conf_energies,
         rotamers=rotamers,
-        rotamer_energies=np.array(rotamer_energies),
+        rotamer_energies=rotamer_energies,
     )
 
 
@@ -108,14 +126,9 @@ def parse_energy_grad(text: str) -> SinglePointResults:
     Returns:
         The parsed energy and gradient as a SinglePointResults object.
     """
-    # Parse the energy
-    energy_regex = r"# Energy \( Eh \)\n#*\n\s*([-\d.]+)"
-    gradient_regex = r"# Gradient \( Eh/a0 \)\n#\s*\n((?:\s*[-\d.]+\n)+)"
-
-    energy = float(regex_search(energy_regex, text).group(1))
-    gradient = np.array(
-        [float(x) for x in regex_search(gradient_regex, text).group(1).split()]
-    )
+    energy = float(regex_search(_ENERGY_REGEX, text).group(1))
+    gradient_block = regex_search(_GRADIENT_REGEX, text).group(1)
+    gradient = np.fromstring(gradient_block, sep=" ").reshape(-1, 3)
     return SinglePointResults(
         energy=energy,
         gradient=gradient,
@@ -155,15 +168,26 @@ def parse_numhess_dir(
 
     Returns:
         The parsed numerical Hessian results as a SinglePointResults object.
+
+    Raises:
+        ParserError: If the file does not contain a square Hessian matrix.
     """
     data = (Path(directory) / filename).read_text()
-    float_regex = r"[-+]?\d*\.\d+|\d+"
-    numbers = re.findall(float_regex, data)
-    array = np.array(numbers, dtype=float)
-    spr_dict: dict[str, Any] = {"hessian": array}
+    # Drop $-prefixed section lines (e.g., $hessian); the rest is whitespace-separated
+    body = "\n".join(
+        line for line in data.splitlines() if not line.lstrip().startswith("$")
+    )
+    values = np.fromstring(body, sep=" ")
+
+    # Shape into the square Hessian; math.isqrt is exact for any matrix size
+    n = math.isqrt(values.size)
+    if n * n != values.size:
+        raise ParserError(
+            f"Expected a square Hessian in '{filename}' but found {values.size} values."
+        )
+    spr_dict: dict[str, Any] = {"hessian": values.reshape(n, n)}
     if stdout:
-        energy_regex = r"Energy\s*=\s*([-+]?\d+\.\d+)\s*Eh"
-        energy = float(regex_search(energy_regex, stdout).group(1))
+        energy = float(regex_search(_NUMHESS_ENERGY_REGEX, stdout).group(1))
         spr_dict["energy"] = energy
     return SinglePointResults(**spr_dict)
 
@@ -199,40 +223,46 @@ def parse_optimization_dir(
     ]
 
     # Fake gradient for each step because CREST does not output it
-    fake_gradient = np.zeros(len(inp_obj.structure.symbols) * 3)
+    fake_gradient = np.zeros((len(inp_obj.structure.symbols), 3))
 
-    # Parse program version
-    program_version = parse_version_string(stdout)
+    # Provenance and the per-step input are validated once and shared by all steps
+    provenance = Provenance(
+        program="crest", program_version=parse_version_string(stdout)
+    )
+    step_input = ProgramInput(
+        calctype=CalcType.gradient,
+        structure=structures[0],
+        model=inp_obj.model,
+    )
 
     # Collect final gradient if calculation succeeded
+    # https://github.com/crest-lab/crest/issues/354
     try:
-        final_spr = parse_singlepoint_dir(directory)
+        final_gradient = parse_singlepoint_dir(directory).gradient
     except FileNotFoundError:
         # Calculation failed, so we don't have the final energy or gradient
-        final_spr = SinglePointResults(gradient=fake_gradient)
+        final_gradient = fake_gradient
+    # qcio copies each gradient on validation, so the frames may share one input
+    gradients = [fake_gradient] * (len(structures) - 1) + [final_gradient]
 
     # Create the optimization trajectory
     trajectory: list[ProgramOutput] = [
         ProgramOutput(
-            input_data=ProgramInput(
-                calctype=CalcType.gradient,
-                structure=struct,
-                model=inp_obj.model,
+            # Shallow copy; give each step its own keywords and extras dicts
+            input_data=step_input.model_copy(
+                update={
+                    "structure": struct,
+                    "keywords": dict(step_input.keywords),
+                    "extras": dict(step_input.extras),
+                }
             ),
             success=True,
-            results=SinglePointResults(energy=energy, gradient=fake_gradient),
-            provenance=Provenance(
-                program="crest",
-                program_version=program_version,
-            ),
+            results=SinglePointResults(energy=energy, gradient=gradient),
+            provenance=provenance,
         )
-        for struct, energy in zip(structures, energies)
+        for struct, energy, gradient in zip(structures, energies, gradients)
     ]
 
-    # Fill in final gradient
-    # https://github.com/crest-lab/crest/issues/354
-    trajectory[-1].results.gradient[:] = final_spr.gradient
-
     return OptimizationResults(
         trajectory=trajectory,
     )
@@ -1,9 +1,11 @@
 """Parsers for TeraChem output files."""
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
+import numpy as np
 from qcio import (
     CalcType,
     OptimizationResults,
@@ -22,18 +24,23 @@ from .utils import parser, regex_search
 SUPPORTED_FILETYPES = {FileType.stdout}
 
 
+# Literal banners identifying the calctype; no regex needed to find them
+_CALCTYPE_MARKERS = (
+    ("SINGLE POINT ENERGY CALCULATIONS", CalcType.energy),
+    ("SINGLE POINT GRADIENT CALCULATIONS", CalcType.gradient),
+    ("FREQUENCY ANALYSIS", CalcType.hessian),
+)
+
+
 def parse_calctype(string: str) -> CalcType:
     """Parse the calctype from TeraChem stdout."""
-    calctypes = {
-        r"SINGLE POINT ENERGY CALCULATIONS": CalcType.energy,
-        r"SINGLE POINT GRADIENT CALCULATIONS": CalcType.gradient,
-        r"FREQUENCY ANALYSIS": CalcType.hessian,
-    }
-    for regex, calctype in calctypes.items():
-        match = re.search(regex, string)
-        if match:
+    for marker, calctype in _CALCTYPE_MARKERS:
+        if marker in string:
             return calctype
-    raise MatchNotFoundError(regex, string)
+    raise MatchNotFoundError(marker, string)
+
+
+_ENERGY_REGEX = re.compile(r"FINAL ENERGY: (-?\d+(?:\.\d+)?)", re.ASCII)
 
 
 @parser()
@@ -44,49 +51,51 @@ def parse_energy(string: str, data_collector: ParsedDataCollector):
         - Works on frequency files containing many energy values because re.search()
             returns the first result
     """
-    regex = r"FINAL ENERGY: (-?\d+(?:\.\d+)?)"
-    data_collector.energy = float(regex_search(regex, string).group(1))
+    data_collector.energy = float(regex_search(_ENERGY_REGEX, string).group(1))
 
 
-def parse_gradients(string: str, all: bool = True) -> list[list[list[float]]]:
-    """Parse gradients from TeraChem stdout.
+# This will match all floats after the dE/dX dE/dY dE/dZ header and stop at the
+# terminating -- or -= line that follows gradients or optimizations.
+_GRADIENT_REGEX = re.compile(
+    r"(?<=dE\/dX\s{12}dE\/dY\s{12}dE\/dZ\n)[\d\.\-\s]+(?=\n(?:--|-=))", re.ASCII
+)
 
-    Args:
-        string: The contents of the TeraChem stdout file.
-        all: If True, return all gradients. If False, return only the first gradient.
 
-    Returns:
-        A list of gradients. Each gradient is a list of 3-element lists, where each
-        3-element list is a gradient for an atom.
-    """
-    # This will match all floats after the dE/dX dE/dY dE/dZ header and stop at the
-    # terminating -- or -= line that follows gradients or optimizations.
-    regex = r"(?<=dE\/dX\s{12}dE\/dY\s{12}dE\/dZ\n)[\d\.\-\s]+(?=\n(?:--|-=))"
+def _parse_gradient_arrays(string: str, all: bool = True) -> list[np.ndarray]:
+    """Parse gradients from TeraChem stdout as N x 3 arrays.
 
+    See parse_gradients for arguments. Returns arrays so callers handing the
+    gradients to qcio models can skip the round trip through Python lists.
+    """
     if all is True:
-        match: Optional[Union[list, re.Match]] = re.findall(regex, string)
+        match: Optional[Union[list, re.Match]] = _GRADIENT_REGEX.findall(string)
     else:
-        match = re.search(regex, string)
+        match = _GRADIENT_REGEX.search(string)
 
     if not match:
-        raise MatchNotFoundError(regex, string)
+        raise MatchNotFoundError(_GRADIENT_REGEX.pattern, string)
 
     grad_strings: list[str] = match if all is True else [match.group()]  # type: ignore
 
-    gradients = []
+    # Cast to floats and arrange into N x 3 gradients in a single NumPy pass each
+    return [
+        np.fromstring(grad_string, sep=" ").reshape(-1, 3)
+        for grad_string in grad_strings
+    ]
 
-    for grad_string in grad_strings:
-        # split string and cast to floats
-        values = [float(val) for val in grad_string.split()]
 
-        # arrange into N x 3 gradient
-        gradient = []
-        for i in range(0, len(values), 3):
-            gradient.append(values[i : i + 3])
+def parse_gradients(string: str, all: bool = True) -> list[list[list[float]]]:
+    """Parse gradients from TeraChem stdout.
 
-        gradients.append(gradient)
+    Args:
+        string: The contents of the TeraChem stdout file.
+        all: If True, return all gradients. If False, return only the first gradient.
 
-    return gradients
+    Returns:
+        A list of gradients. Each gradient is a list of 3-element lists, where each
+        3-element list is a gradient for an atom.
+    """
+    return [gradient.tolist() for gradient in _parse_gradient_arrays(string, all)]
 
 
 @parser(only=[CalcType.gradient, CalcType.hessian])
@@ -97,69 +106,99 @@ def parse_gradient(string: str, data_collector: ParsedDataCollector):
     data_collector.gradient = gradient
 
 
+_HESSIAN_HEADER = "*** Hessian Matrix"
+# Matches one printed chunk of a Hessian row: the row index and up to six floats
+_HESSIAN_ROW_REGEX = re.compile(
+    r"\s+([1-9]\d*)\s((?:\s-?\d\.\d{15}e[+-]\d{2})+)", re.ASCII
+)
+
+
 @parser(only=[CalcType.hessian])
 def parse_hessian(string: str, data_collector: ParsedDataCollector):
     """Parse Hessian Matrix from TeraChem stdout
 
     Notes:
-        This function searches the entire document N times for all regex matches where
-        N is the number of atoms. This makes the function's code easy to reason about.
-        If performance becomes an issues for VERY large Hessians (unlikely) you can
-        accelerate this function by parsing all Hessian floats in one pass, like the
-        parse_gradient function above, and then doing the math to figure out how to
-        properly sequence those values to from the Hessian matrix given TeraChem's
-        six-column format for printing out Hessian matrix entries.
+        TeraChem prints the Hessian in blocks of six columns and every block repeats
+        all row indices. The row chunks are collected in a single pass over the
+        document and stitched back together by their row index.
     """
-    # requires .format(int). {{}} values are to escape {15|2} for .format()
-    regex = r"(?:\s+{}\s)((?:\s-?\d\.\d{{15}}e[+-]\d{{2}})+)"
-    hessian = []
-
-    # Match all rows containing Hessian data; one set of rows at a time
-    count = 1
-    while matches := re.findall(regex.format(count), string):
-        row = []
-        for match in matches:
-            row.extend([float(val) for val in match.split()])
-        hessian.append(row)
-        count += 1
+    # Skip the SCF and displacement output preceding the Hessian, if it is labeled
+    start = max(string.find(_HESSIAN_HEADER), 0)
+
+    row_chunks: list[list[str]] = []
+    for match in _HESSIAN_ROW_REGEX.finditer(string, start):
+        index = int(match.group(1)) - 1
+        while len(row_chunks) <= index:
+            row_chunks.append([])
+        row_chunks[index].append(match.group(2))
+
+    if not row_chunks:
+        raise MatchNotFoundError(_HESSIAN_ROW_REGEX.pattern, string)
+
+    # Assert we have recovered a square Hessian matrix
+    n_rows = len(row_chunks)
+    rows = [" ".join(chunks) for chunks in row_chunks]
+    for i, row in enumerate(rows):
+        n_values = len(row.split())
+        assert n_values == n_rows, (
+            "We must have missed some floats. Hessian should be a square matrix. "
+            f"Only recovered {n_values} of {n_rows} floats for row {i}."
+        )
 
-    if not hessian:
-        raise MatchNotFoundError(regex, string)
+    # Cast all rows to floats in a single NumPy pass into one contiguous buffer
+    values = np.fromstring(" ".join(rows), sep=" ")
+    data_collector.hessian = values.reshape(n_rows, n_rows).tolist()
 
-    # Assert we have created a square Hessian matrix
-    for i, row in enumerate(hessian):
-        assert len(row) == len(
-            hessian
-        ), "We must have missed some floats. Hessian should be a square matrix. Only "
-        f"recovered {len(row)} of {len(hessian)} floats for row {i}."
 
-    data_collector.hessian = hessian
+_NATOMS_REGEX = re.compile(r"Total atoms:\s*(\d+)", re.ASCII)
+_NMO_REGEX = re.compile(r"Total orbitals:\s*(\d+)", re.ASCII)
 
 
 @parser()
 def parse_natoms(string: str, data_collector: ParsedDataCollector):
     """Parse number of atoms value from TeraChem stdout"""
-    regex = r"Total atoms:\s*(\d+)"
-    data_collector.calcinfo_natoms = int(regex_search(regex, string).group(1))
+    data_collector.calcinfo_natoms = int(regex_search(_NATOMS_REGEX, string).group(1))
 
 
 @parser()
 def parse_nmo(string: str, data_collector: ParsedDataCollector):
     """Parse the number of molecular orbitals TeraChem stdout"""
-    regex = r"Total orbitals:\s*(\d+)"
-    data_collector.calcinfo_nmo = int(regex_search(regex, string).group(1))
+    data_collector.calcinfo_nmo = int(regex_search(_NMO_REGEX, string).group(1))
+
+
+# TeraChem prints its version banner in the first lines of stdout
+_HEADER_SIZE = 4096
+_VERSION_CONTROL_REGEX = re.compile(r"(?:Git|Hg) Version: (\S*)", re.ASCII)
+_TERACHEM_VERSION_REGEX = re.compile(r"TeraChem (v\S*)", re.ASCII)
+
+
+def _header_end(string: str) -> int:
+    """Index of the last line break within the header.
+
+    Ending the header on a line boundary keeps a match from being cut short.
+    """
+    if len(string) <= _HEADER_SIZE:
+        return len(string)
+    return max(string.rfind("\n", 0, _HEADER_SIZE), 0)
+
+
+def _header_search(regex: re.Pattern, string: str) -> re.Match:
+    """Search the stdout header first and fall back to the full string.
+
+    Keeps header-only parsers O(header) instead of O(filesize) on large outputs.
+    """
+    match = regex.search(string, 0, _header_end(string))
+    return match if match else regex_search(regex, string)
 
 
 def parse_version_control_details(string: str) -> str:
     """Parse TeraChem git commit or Hg version from TeraChem stdout."""
-    regex = r"(Git|Hg) Version: (\S*)"
-    return regex_search(regex, string).group(2)
+    return _header_search(_VERSION_CONTROL_REGEX, string).group(1)
 
 
 def parse_terachem_version(string: str) -> str:
     """Parse TeraChem version from TeraChem stdout."""
-    regex = r"TeraChem (v\S*)"
-    return regex_search(regex, string).group(1)
+    return _header_search(_TERACHEM_VERSION_REGEX, string).group(1)
 
 
 def parse_version_string(string: str) -> str:
@@ -167,16 +206,35 @@ def parse_version_string(string: str) -> str:
 
     Matches format of 'terachem --version' on command line.
     """
-    return f"{parse_terachem_version(string)} [{parse_version_control_details(string)}]"
+    # Key the cache on the build banner only; per-job details follow "Job started"
+    banner_end = string.find("Job started", 0, _HEADER_SIZE)
+    if banner_end == -1:
+        banner_end = _header_end(string)
+    banner = string[:banner_end]
+    try:
+        return _banner_version_string(banner)
+    except MatchNotFoundError:
+        # Banner not within the header; parse from the full string
+        return (
+            f"{parse_terachem_version(string)} "
+            f"[{parse_version_control_details(string)}]"
+        )
+
+
+@lru_cache(maxsize=256)
+def _banner_version_string(banner: str) -> str:
+    """Parse the version string from the TeraChem build banner.
+
+    Cached because batches of outputs from the same TeraChem build share a banner.
+    """
+    version = regex_search(_TERACHEM_VERSION_REGEX, banner).group(1)
+    version_control = regex_search(_VERSION_CONTROL_REGEX, banner).group(1)
+    return f"{version} [{version_control}]"
 
 
 def calculation_succeeded(string: str) -> bool:
     """Determine from TeraChem stdout if a calculation completed successfully."""
-    regex = r"Job finished:"
-    if re.search(regex, string):
-        # If any match for a failure regex is found, the calculation failed
-        return True
-    return False
+    return "Job finished:" in string
 
 
 def parse_optimization_dir(
@@ -204,36 +262,47 @@ def parse_optimization_dir(
     # Parse Values
     from qcparse import parse
 
-    # Parse all the values from the stdout file
-    spr = parse(stdout, "terachem", "stdout", CalcType.energy)
-
-    gradients = parse_gradients(stdout)
-    program_version = parse_version_string(stdout)
+    # Parse all the values from the stdout file. Dumped once and shared by all steps.
+    spr_dict = parse(stdout, "terachem", "stdout", CalcType.energy).model_dump()
+
+    gradients = _parse_gradient_arrays(stdout)
+    # Provenance is identical for every step, so build and validate it once
+    provenance = Provenance(
+        program="terachem",
+        program_version=parse_version_string(stdout),
+        scratch_dir=directory.parent,
+    )
+
+    # Validate the per-step input once; each step only swaps in its structure
+    step_input = ProgramInput(
+        calctype=CalcType.gradient,
+        structure=structures[0],
+        model=inp_obj.model,
+        keywords=inp_obj.keywords,
+    )
+    comment_key = Structure._xyz_comment_key
 
     # Create the trajectory
     trajectory: list[ProgramOutput] = [
         ProgramOutput(
-            input_data=ProgramInput(
-                calctype=CalcType.gradient,
-                structure=structure,
-                model=inp_obj.model,
-                keywords=inp_obj.keywords,
+            # Shallow copy; give each step its own keywords and extras dicts
+            input_data=step_input.model_copy(
+                update={
+                    "structure": structure,
+                    "keywords": dict(step_input.keywords),
+                    "extras": dict(step_input.extras),
+                }
             ),
             results=SinglePointResults(
                 **{
-                    **spr.model_dump(),
+                    **spr_dict,
                     # TeraChem places the energy as the first comment in the xyz file
-                    "energy": structure.extras[Structure._xyz_comment_key][0],
-                    # # Will be coerced by Pydantic to np.ndarray
-                    "gradient": gradient,  # type: ignore
+                    "energy": structure.extras[comment_key][0],
+                    "gradient": gradient,
                 }
             ),
             success=True,
-            provenance=Provenance(
-                program="terachem",
-                program_version=program_version,
-                scratch_dir=directory.parent,
-            ),
+            provenance=provenance,
         )
         for structure, gradient in zip(structures, gradients)
     ]
@@ -1,7 +1,6 @@
-import importlib
-import inspect
 import re
-from typing import Optional
+import sys
+from typing import Optional, Union
 
 from qcio import CalcType
 
@@ -27,11 +26,11 @@ def parser(
 
     def decorator(func):
         # Get the current module name. Should match program name.
-        module = inspect.getmodule(func).__name__
-        program_name = module.split(".")[-1]
+        module = func.__module__
+        program_name = module.rsplit(".", 1)[-1]
 
-        # Dynamically import the relevant FileTypes Enum from the module
-        supported_file_types = importlib.import_module(f"{module}").SUPPORTED_FILETYPES
+        # The module is mid-import but already in sys.modules; read its FileTypes
+        supported_file_types = sys.modules[module].SUPPORTED_FILETYPES
 
         # Check if filetype is a member of the relevant Enum
         if filetype not in supported_file_types:
@@ -57,14 +56,14 @@ def parser(
     return decorator
 
 
-def regex_search(regex: str, string: str) -> re.Match:
+def regex_search(regex: Union[str, re.Pattern], string: str) -> re.Match:
     """Function for matching a regex to a string.
 
     Will match and return the first match found or raise MatchNotFoundError
     if no match is found.
 
     Args:
-        regex: A regular expression string.
+        regex: A regular expression string or compiled pattern.
         string: The string to match on.
 
     Returns:
@@ -73,6 +72,13 @@ def regex_search(regex: str, string: str) -> re.Match:
     Raises:
         MatchNotFoundError if no match found.
     """
+    if isinstance(regex, re.Pattern):
+        # Compiled patterns skip the lookup in re's internal pattern cache
+        match = regex.search(string)
+        if not match:
+            raise MatchNotFoundError(regex.pattern, string)
+        return match
+
     match = re.search(regex, string)
     if not match:
         raise MatchNotFoundError(regex, string)
@@ -6,6 +6,9 @@ from qcio import Structure
 
 hydrogen_atom = Structure(symbols=["H"], geometry=np.array([[0, 0, 0]]))
 
+# Longest path Linux accepts; longer strings are always file contents
+PATH_MAX = 4096
+
 
 def get_file_contents(data_or_path: Union[str, bytes, Path]) -> Union[str, bytes]:
     """Return the file content from a path, str, or bytes and the associated path.
@@ -22,6 +25,12 @@ def get_file_contents(data_or_path: Union[str, bytes, Path]) -> Union[str, bytes
     if isinstance(data_or_path, bytes):
         return data_or_path
 
+    # Strings that cannot be paths are file contents; skip Path() and the stat()
+    if isinstance(data_or_path, str) and (
+        "\n" in data_or_path or "\x00" in data_or_path or len(data_or_path) > PATH_MAX
+    ):
+        return data_or_path
+
     filepath = Path(data_or_path)
     try:
         if filepath.is_file():
@@ -34,7 +43,7 @@ def get_file_contents(data_or_path: Union[str, bytes, Path]) -> Union[str, bytes
         else:
             file_content = str(data_or_path)
     except OSError:
-        # String too long to be filepath
+        # String too long to be filepath on this platform (e.g., over NAME_MAX)
         file_content = str(data_or_path)
 
     return file_content
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -14,9 +15,19 @@ def test_data_dir():
 
 
 @pytest.fixture(scope="session")
-def terachem_energy_stdout(test_data_dir):
-    with open(test_data_dir / "water.energy.out") as f:
-        return f.read()
+def test_file_contents(test_data_dir):
+    """Create a function that reads a test data file once per session."""
+
+    @lru_cache(maxsize=None)
+    def read_contents(relpath: str) -> str:
+        return (test_data_dir / relpath).read_text()
+
+    return read_contents
+
+
+@pytest.fixture(scope="session")
+def terachem_energy_stdout(test_file_contents):
+    return test_file_contents("water.energy.out")
 
 
 @pytest.fixture(scope="function")
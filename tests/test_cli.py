@@ -1,18 +1,17 @@
-import subprocess
+import sys
 
+from qcparse.cli import main
 from qcparse.main import parse
 
 
-def test_cli(test_data_dir):
-    # Call CLI script as a subprocess
+def test_cli(test_data_dir, monkeypatch, capsys):
+    # Call the CLI entry point in-process rather than spawning a subprocess
     filepath = str(test_data_dir / "water.energy.out")
-    result = subprocess.run(
-        ["qcparse", "terachem", filepath], capture_output=True, text=True
-    )
-    # Check the return code
-    assert result.returncode == 0
+    monkeypatch.setattr(sys, "argv", ["qcparse", "terachem", filepath])
+    # Any exception raised by the CLI, e.g. a parser error, fails the test
+    main()
 
     # Check the output
     parse_result = parse(filepath, "terachem")
     expected_output = parse_result.model_dump_json(indent=4)
-    assert result.stdout.strip() == expected_output
+    assert capsys.readouterr().out.strip() == expected_output
@@ -4,7 +4,7 @@ from qcio import ProgramInput, Structure
 from qcio.utils import water
 
 from qcparse.encoders.crest import _to_toml_dict, validate_input
-from qcparse.exceptions import EncoderError
+from qcparse.exceptions import EncoderError, ParserError
 from qcparse.parsers.crest import (
     parse_conformer_search_dir,
     parse_energy_grad,
@@ -16,8 +16,8 @@ from qcparse.parsers.crest import (
 )
 
 
-def test_parse_version_string(test_data_dir):
-    text = (test_data_dir / "crest_stdout.txt").read_text()
+def test_parse_version_string(test_file_contents):
+    text = test_file_contents("crest_stdout.txt")
     assert parse_version_string(text) == "3.0.1"
 
 
@@ -117,8 +117,8 @@ def test_parse_conformer_search_charge_multiplicity(test_data_dir):
             assert struct.multiplicity == 3
 
 
-def test_parse_energy_grad(test_data_dir):
-    text = (test_data_dir / "crest_output" / "crest.engrad").read_text()
+def test_parse_energy_grad(test_file_contents):
+    text = test_file_contents("crest_output/crest.engrad")
     spr = parse_energy_grad(text)
     assert spr.energy == -0.335557824179335
     np.testing.assert_array_equal(
@@ -144,9 +144,9 @@ def test_parse_singlepoint_dir(test_data_dir):
     )
 
 
-def test_parse_optimization_dir(test_data_dir, prog_inp):
+def test_parse_optimization_dir(test_data_dir, test_file_contents, prog_inp):
     prog_input = prog_inp("optimization")
-    stdout = (test_data_dir / "crest_output" / "optstdout.txt").read_text()
+    stdout = test_file_contents("crest_output/optstdout.txt")
     opt_res = parse_optimization_dir(
         test_data_dir / "crest_output", inp_obj=prog_input, stdout=stdout
     )
@@ -162,6 +162,11 @@ def test_parse_optimization_dir(test_data_dir, prog_inp):
         ],
     )
 
+    # Steps must not share mutable dicts with each other
+    first, last = opt_res.trajectory[0], opt_res.trajectory[-1]
+    assert first.input_data.keywords is not last.input_data.keywords
+    assert first.input_data.extras is not last.input_data.extras
+
 
 def test_parse_numhess_dir(test_data_dir):
     stdout = """
@@ -281,3 +286,9 @@ def test_parse_numhess_dir(test_data_dir):
             ],
         ],
     )
+
+
+def test_parse_numhess_dir_raises_error_if_not_square(tmp_path):
+    (tmp_path / "numhess1").write_text(" $hessian\n  0.1 0.2 0.3\n")
+    with pytest.raises(ParserError):
+        parse_numhess_dir(tmp_path)
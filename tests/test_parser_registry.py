@@ -1,7 +1,8 @@
 import pytest
+from qcio import CalcType
 
 from qcparse.exceptions import RegistryError
-from qcparse.models import ParserSpec, registry
+from qcparse.models import ParserRegistry, ParserSpec, registry
 
 
 def test_get_parsers_program():
@@ -40,3 +41,36 @@ def test_supported_filetypes():
     filetypes = registry.supported_filetypes("terachem")
     assert filetypes
     assert "stdout" in filetypes
+
+
+def test_get_parsers_reflects_newly_registered_parsers():
+    local_registry = ParserRegistry()
+    spec = ParserSpec(
+        parser=lambda string, data_collector: None,
+        filetype="stdout",
+        required=True,
+        calctypes=[CalcType.energy],
+    )
+    local_registry.register("program", spec)
+    assert local_registry.get_parsers("program", "stdout") == [spec]
+
+    new_spec = spec.model_copy(update={"required": False})
+    local_registry.register("program", new_spec)
+    assert local_registry.get_parsers("program", "stdout") == [spec, new_spec]
+
+
+def test_get_parsers_returns_copies():
+    local_registry = ParserRegistry()
+    spec = ParserSpec(
+        parser=lambda string, data_collector: None,
+        filetype="stdout",
+        required=True,
+        calctypes=[CalcType.energy],
+    )
+    local_registry.register("program", spec)
+
+    # Mutating a returned list must not leak into the cache or the registry
+    local_registry.get_parsers("program").append(spec)
+    local_registry.get_parsers("program").clear()
+    assert local_registry.get_parsers("program") == [spec]
+    assert local_registry.registry["program"] == [spec]
@@ -28,9 +28,8 @@ from .data import gradients, hessians
         ("water.frequencies.out", -76.3861099088),
     ),
 )
-def test_parse_energy(test_data_dir, data_collector, filename, energy):
-    with open(test_data_dir / filename) as f:
-        tcout = f.read()
+def test_parse_energy(test_file_contents, data_collector, filename, energy):
+    tcout = test_file_contents(filename)
     parse_energy(tcout, data_collector)
 
 
@@ -62,9 +61,8 @@ def test_parse_energy_raises_exception(data_collector):
         ("water.frequencies.out", CalcType.hessian),
     ),
 )
-def test_parse_calctype(test_data_dir, filename, calctype):
-    with open(test_data_dir / filename) as f:
-        string = f.read()
+def test_parse_calctype(test_file_contents, filename, calctype):
+    string = test_file_contents(filename)
     assert parse_calctype(string) == calctype
 
 
@@ -78,8 +76,16 @@ def test_parse_version_git(terachem_energy_stdout):
     assert parsed == "v1.9-2022.03-dev [4daa16dd21e78d64be5415f7663c3d7c2785203c]"
 
 
-def test_parse_version_hg(test_data_dir):
-    hg_stdout = (test_data_dir / "hg.out").read_text()
+def test_parse_version_straddling_header_end(terachem_energy_stdout):
+    # No "Job started" within the header and the Git Version line crosses its end
+    line_start = terachem_energy_stdout.index("Git Version:")
+    padded = "\n" * (4096 - 20 - line_start) + terachem_energy_stdout
+    parsed = parse_version_string(padded)
+    assert parsed == "v1.9-2022.03-dev [4daa16dd21e78d64be5415f7663c3d7c2785203c]"
+
+
+def test_parse_version_hg(test_file_contents):
+    hg_stdout = test_file_contents("hg.out")
     parsed = parse_version_string(hg_stdout)
     assert parsed == "v1.5K [ccdev]"
 
@@ -105,9 +111,8 @@ def test_calculation_succeeded(terachem_energy_stdout):
         ("failure.basis.out", False),
     ),
 )
-def test_calculation_succeeded_cuda_failure(test_data_dir, filename, result):
-    with open(test_data_dir / filename) as f:
-        tcout = f.read()
+def test_calculation_succeeded_cuda_failure(test_file_contents, filename, result):
+    tcout = test_file_contents(filename)
     assert calculation_succeeded(tcout) is result
 
 
@@ -128,9 +133,8 @@ def test_calculation_succeeded_cuda_failure(test_data_dir, filename, result):
         ),
     ),
 )
-def test_parse_gradient(test_data_dir, filename, gradient, data_collector):
-    with open(test_data_dir / filename) as f:
-        tcout = f.read()
+def test_parse_gradient(test_file_contents, filename, gradient, data_collector):
+    tcout = test_file_contents(filename)
 
     parse_gradient(tcout, data_collector)
     assert data_collector.gradient == gradient
@@ -149,21 +153,31 @@ def test_parse_gradient(test_data_dir, filename, gradient, data_collector):
         ),
     ),
 )
-def test_parse_hessian(test_data_dir, filename, hessian, data_collector):
-    with open(test_data_dir / filename) as f:
-        tcout = f.read()
+def test_parse_hessian(test_file_contents, filename, hessian, data_collector):
+    tcout = test_file_contents(filename)
 
     parse_hessian(tcout, data_collector)
     assert data_collector.hessian == hessian
 
 
+def test_parse_hessian_raises_exception_on_ragged_rows(data_collector):
+    # Four floats in total, but split 1/3 across two rows instead of 2/2
+    value = "1.000000000000000e+00"
+    tcout = (
+        "*** Hessian Matrix (Hartree/Bohr^2) ***\n"
+        f"   1  {value}\n"
+        f"   2  {value} {value} {value}\n"
+    )
+    with pytest.raises(AssertionError):
+        parse_hessian(tcout, data_collector)
+
+
 @pytest.mark.parametrize(
     "filename,n_atoms",
     (("water.energy.out", 3), ("caffeine.gradient.out", 24)),
 )
-def test_parse_natoms(test_data_dir, filename, n_atoms, data_collector):
-    with open(test_data_dir / filename) as f:
-        tcout = f.read()
+def test_parse_natoms(test_file_contents, filename, n_atoms, data_collector):
+    tcout = test_file_contents(filename)
 
     parse_natoms(tcout, data_collector)
     assert data_collector.calcinfo_natoms == n_atoms
@@ -173,9 +187,8 @@ def test_parse_natoms(test_data_dir, filename, n_atoms, data_collector):
     "filename,nmo",
     (("water.energy.out", 13), ("caffeine.gradient.out", 146)),
 )
-def test_parse_nmo(test_data_dir, filename, nmo, data_collector):
-    with open(test_data_dir / filename) as f:
-        tcout = f.read()
+def test_parse_nmo(test_file_contents, filename, nmo, data_collector):
+    tcout = test_file_contents(filename)
 
     parse_nmo(tcout, data_collector)
     assert data_collector.calcinfo_nmo == nmo
@@ -189,6 +202,17 @@ def test_parse_git_commit(terachem_energy_stdout):
     )
 
 
+def test_parse_git_commit_straddling_header_end(terachem_energy_stdout):
+    # Pad the stdout so the Git Version line crosses the end of the header window
+    line_start = terachem_energy_stdout.index("Git Version:")
+    padded = "\n" * (4096 - 20 - line_start) + terachem_energy_stdout
+    git_commit = parse_version_control_details(padded)
+    assert (
+        git_commit
+        == "4daa16dd21e78d64be5415f7663c3d7c2785203c"  # pragma: allowlist secret
+    )
+
+
 def test_write_input_files(prog_inp):
     """Test write_input_files method."""
     prog_inp = prog_inp("energy")
@@ -244,16 +268,16 @@ def test_encode_raises_error_qcio_args_passes_as_keywords(prog_inp):
             encode(prog_inp)
 
 
-def test_parse_gradients(test_data_dir):
-    stdout_opt = (test_data_dir / "terachem_opt" / "tc.out").read_text()
+def test_parse_gradients(test_file_contents):
+    stdout_opt = test_file_contents("terachem_opt/tc.out")
 
     parsed_gradients = parse_gradients(stdout_opt)
     assert parsed_gradients == gradients.water_opt
 
 
-def test_parse_optimization_dir(test_data_dir, prog_inp):
+def test_parse_optimization_dir(test_data_dir, test_file_contents, prog_inp):
     opt_inp = prog_inp("optimization")
-    stdout = (test_data_dir / "terachem_opt" / "tc.out").read_text()
+    stdout = test_file_contents("terachem_opt/tc.out")
     opt_results = parse_optimization_dir(
         test_data_dir / "terachem_opt", stdout, inp_obj=opt_inp
     )
@@ -268,3 +292,8 @@ def test_parse_optimization_dir(test_data_dir, prog_inp):
             == "v1.9-2023.09-dev [2407d3d72955905cdd9c0dproae51e9322b8c05fd4c]"
         )
         assert prog_output.provenance.scratch_dir == test_data_dir
+
+    # Steps must not share mutable dicts with each other
+    first, last = opt_results.trajectory[0], opt_results.trajectory[-1]
+    assert first.input_data.keywords is not last.input_data.keywords
+    assert first.input_data.extras is not last.input_data.extras
@@ -46,3 +46,10 @@ def test_file_contents_with_long_str_not_filepath():
     test_data = "x" * (os.pathconf(".", "PC_PATH_MAX") + 1)
     file_content = get_file_contents(test_data)
     assert file_content == test_data
+
+
+def test_file_contents_with_multiline_str_not_filepath():
+    """Test get_file_contents with a multi-line str that is not a filepath"""
+    test_data = "line one\nline two\n"
+    file_content = get_file_contents(test_data)
+    assert file_content == test_data